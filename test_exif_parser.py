@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tests for the direct JPEG EXIF date parser in watermark.py
+"""
+
+import struct
+import unittest
+
+import watermark
+
+DATE_ORIGINAL = b'2020:01:02 03:04:05\x00'
+DATE_MODIFIED = b'2021:02:03 04:05:06\x00'
+
+
+def build_tiff(byte_order, exif_offset=None):
+    """Build TIFF data with IFD0 DateTime and an EXIF IFD with DateTimeOriginal"""
+    fmt = '<' if byte_order == b'II' else '>'
+
+    # Layout: header (8), IFD0 with 2 entries (30), EXIF IFD with 1 entry (18), values
+    ifd0_offset = 8
+    exif_ifd_offset = ifd0_offset + 30
+    modified_offset = exif_ifd_offset + 18
+    original_offset = modified_offset + len(DATE_MODIFIED)
+    if exif_offset is None:
+        exif_offset = exif_ifd_offset
+
+    tiff = byte_order + struct.pack(fmt + 'HI', 42, ifd0_offset)
+    tiff += struct.pack(fmt + 'H', 2)
+    tiff += struct.pack(fmt + 'HHII', 0x0132, 2, len(DATE_MODIFIED), modified_offset)
+    tiff += struct.pack(fmt + 'HHII', 0x8769, 4, 1, exif_offset)
+    tiff += struct.pack(fmt + 'I', 0)
+    tiff += struct.pack(fmt + 'H', 1)
+    tiff += struct.pack(fmt + 'HHII', 0x9003, 2, len(DATE_ORIGINAL), original_offset)
+    tiff += struct.pack(fmt + 'I', 0)
+    return tiff + DATE_MODIFIED + DATE_ORIGINAL
+
+
+def segment(marker, payload):
+    """Build a JPEG marker segment"""
+    return b'\xff' + bytes([marker]) + struct.pack('>H', len(payload) + 2) + payload
+
+
+def build_jpeg(*segments):
+    """Build the leading bytes of a JPEG up to the start of scan"""
+    return watermark.JPEG_SOI + b''.join(segments) + b'\xff\xda'
+
+
+class JpegExifDatesTest(unittest.TestCase):
+
+    def test_little_endian(self):
+        header = build_jpeg(segment(0xE1, b'Exif\x00\x00' + build_tiff(b'II')))
+        self.assertEqual(watermark._jpeg_exif_dates(header), {
+            'Image DateTime': '2021:02:03 04:05:06',
+            'EXIF DateTimeOriginal': '2020:01:02 03:04:05',
+        })
+
+    def test_big_endian(self):
+        header = build_jpeg(segment(0xE1, b'Exif\x00\x00' + build_tiff(b'MM')))
+        self.assertEqual(watermark._jpeg_exif_dates(header), {
+            'Image DateTime': '2021:02:03 04:05:06',
+            'EXIF DateTimeOriginal': '2020:01:02 03:04:05',
+        })
+
+    def test_jfif_and_xmp_before_exif(self):
+        header = build_jpeg(
+            segment(0xE0, b'JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00'),
+            segment(0xE1, b'http://ns.adobe.com/xap/1.0/\x00<x:xmpmeta/>'),
+            segment(0xE1, b'Exif\x00\x00' + build_tiff(b'II')),
+        )
+        dates = watermark._jpeg_exif_dates(header)
+        self.assertEqual(dates['EXIF DateTimeOriginal'], '2020:01:02 03:04:05')
+
+    def test_app1_cut_off_by_header(self):
+        header = build_jpeg(segment(0xE1, b'Exif\x00\x00' + build_tiff(b'II')))
+        self.assertIsNone(watermark._find_app1(header[:40]))
+        self.assertIsNone(watermark._jpeg_exif_dates(header[:40]))
+
+    def test_ifd_offset_out_of_range(self):
+        tiff = build_tiff(b'II', exif_offset=0xFFFF)
+        header = build_jpeg(segment(0xE1, b'Exif\x00\x00' + tiff))
+        self.assertIsNone(watermark._jpeg_exif_dates(header))
+
+    def test_not_a_jpeg(self):
+        self.assertIsNone(watermark._jpeg_exif_dates(build_tiff(b'II')))
+
+
+class FormatExifDateTest(unittest.TestCase):
+
+    def test_valid_date(self):
+        self.assertEqual(watermark._format_exif_date('2020:01:02 03:04:05'), '2020-01-02')
+
+    def test_placeholder_date(self):
+        self.assertIsNone(watermark._format_exif_date('0000:00:00 00:00:00'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,14 +4,79 @@ Photo Watermark CLI Tool
 Adds date watermarks to images based on EXIF data
 """
 
+import io
 import os
 import sys
+import struct
+import queue
 import argparse
+import functools
+import itertools
+import collections
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Tuple, List
+from typing import BinaryIO, Dict, Iterable, Iterator, Optional, Tuple
 import exifread
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+
+# Optional: NumPy arrays for the OpenCV path
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional: OpenCV decode/draw/encode pipeline used by --fast
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+# Optional: progress bar on interactive terminals
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+
+# Supported input file suffixes (lowercase)
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.webp'})
+
+# EXIF date tags in order of preference
+EXIF_DATE_TAGS = (
+    'EXIF DateTimeOriginal',
+    'EXIF DateTime',
+    'Image DateTime'
+)
+
+# EXIF lives near the start of the file; read this much before falling back
+EXIF_HEADER_SIZE = 64 * 1024
+
+JPEG_SOI = b'\xff\xd8'
+JPEG_APP1 = 0xE1
+JPEG_SOS = 0xDA
+
+EXIF_APP1_PREFIX = b'Exif\x00\x00'
+TIFF_BYTE_ORDERS = {b'II': '<', b'MM': '>'}
+TIFF_TYPE_ASCII = 2
+TIFF_TAG_EXIF_OFFSET = 0x8769
+
+# Date tag IDs per IFD, named as exifread names them
+IFD0_DATE_TAGS = {0x0132: 'Image DateTime'}
+EXIF_IFD_DATE_TAGS = {0x9003: 'EXIF DateTimeOriginal', 0x0132: 'EXIF DateTime'}
+
+# Below this many images the process pool costs more than it saves
+MIN_PARALLEL_IMAGES = 4
+
+# Threads reading EXIF dates ahead of the watermarking processes
+EXIF_READ_THREADS = 4
+
+# Without a progress bar, print a summary line every this many images
+PROGRESS_INTERVAL = 100
+
+# Hershey font used by the OpenCV (--fast) path
+CV2_FONT = cv2.FONT_HERSHEY_SIMPLEX if cv2 is not None else None
 
 
 class WatermarkPosition:
@@ -35,6 +100,250 @@ class WatermarkPosition:
         ]
 
 
+def _find_app1(header: bytes) -> Optional[Tuple[int, int]]:
+    """
+    Locate the APP1 (EXIF) segment by walking the JPEG markers
+
+    Other APP1 segments, such as XMP, are skipped.
+
+    Args:
+        header: Leading bytes of a JPEG file
+
+    Returns:
+        (start, end) offsets of the segment payload, or None if the segment
+        is missing or not fully contained in the header
+    """
+    if not header.startswith(JPEG_SOI):
+        return None
+
+    pos = len(JPEG_SOI)
+    while pos + 4 <= len(header):
+        if header[pos] != 0xFF:
+            return None
+        marker = header[pos + 1]
+        if marker == 0xFF:
+            # Fill byte before the actual marker
+            pos += 1
+            continue
+        if marker == JPEG_SOS:
+            return None
+
+        length = struct.unpack('>H', header[pos + 2:pos + 4])[0]
+        start, end = pos + 4, pos + 2 + length
+        if marker == JPEG_APP1:
+            if end > len(header):
+                return None
+            if header[start:start + len(EXIF_APP1_PREFIX)] == EXIF_APP1_PREFIX:
+                return (start, end)
+        pos = end
+
+    return None
+
+
+def _ifd_entries(tiff: bytes, offset: int,
+                 byte_order: str) -> Iterator[Tuple[int, int, int, int]]:
+    """
+    Iterate over the 12-byte entries of a TIFF IFD
+
+    Args:
+        tiff: TIFF data, offsets are relative to its start
+        offset: Offset of the IFD
+        byte_order: struct byte order character ('<' or '>')
+
+    Yields:
+        (tag, type, count, value_field_offset) for each entry
+    """
+    count = struct.unpack_from(byte_order + 'H', tiff, offset)[0]
+    for i in range(count):
+        entry = offset + 2 + 12 * i
+        tag, tag_type, value_count = struct.unpack_from(byte_order + 'HHI', tiff, entry)
+        yield (tag, tag_type, value_count, entry + 8)
+
+
+def _ifd_dates(tiff: bytes, offset: int, byte_order: str,
+               date_tags: Dict[int, str], dates: Dict[str, str]) -> Optional[int]:
+    """
+    Collect ASCII date tags from one IFD
+
+    Args:
+        tiff: TIFF data, offsets are relative to its start
+        offset: Offset of the IFD
+        byte_order: struct byte order character ('<' or '>')
+        date_tags: Tag IDs to collect, mapped to their exifread names
+        dates: Dictionary the found date strings are added to
+
+    Returns:
+        Offset of the EXIF IFD if this IFD points to one, else None
+    """
+    exif_offset = None
+    for tag, tag_type, count, field in _ifd_entries(tiff, offset, byte_order):
+        if tag == TIFF_TAG_EXIF_OFFSET:
+            exif_offset = struct.unpack_from(byte_order + 'I', tiff, field)[0]
+        elif tag in date_tags and tag_type == TIFF_TYPE_ASCII:
+            # Values over 4 bytes live at the offset stored in the entry
+            if count > 4:
+                field = struct.unpack_from(byte_order + 'I', tiff, field)[0]
+            value = tiff[field:field + count]
+            dates[date_tags[tag]] = value.split(b'\x00', 1)[0].decode('ascii', 'replace')
+    return exif_offset
+
+
+def _jpeg_exif_dates(header: bytes) -> Optional[Dict[str, str]]:
+    """
+    Read the date tags straight from a JPEG's APP1 segment
+
+    Only walks IFD0 and the EXIF IFD, which is far cheaper than building
+    exifread's full tag dictionary.
+
+    Args:
+        header: Leading bytes of the image file
+
+    Returns:
+        Date strings keyed like exifread tags (possibly empty), or None if
+        the header holds no EXIF data this parser understands
+    """
+    segment = _find_app1(header)
+    if segment is None:
+        return None
+
+    start, end = segment
+    tiff = header[start + len(EXIF_APP1_PREFIX):end]
+
+    byte_order = TIFF_BYTE_ORDERS.get(tiff[:2])
+    if byte_order is None:
+        return None
+
+    dates = {}
+    try:
+        ifd0 = struct.unpack_from(byte_order + 'I', tiff, 4)[0]
+        exif_ifd = _ifd_dates(tiff, ifd0, byte_order, IFD0_DATE_TAGS, dates)
+        if exif_ifd is not None:
+            _ifd_dates(tiff, exif_ifd, byte_order, EXIF_IFD_DATE_TAGS, dates)
+    except struct.error:
+        # Offsets pointing outside the segment
+        return None
+
+    return dates
+
+
+def _read_exif_tags(f: BinaryIO, header: bytes) -> dict:
+    """
+    Read EXIF tags, parsing only the file header when it holds the EXIF data
+
+    Args:
+        f: Image file opened in binary mode
+        header: The first EXIF_HEADER_SIZE bytes of the file
+
+    Returns:
+        Dictionary of exifread tags
+    """
+    # Stop at DateTimeOriginal and skip MakerNote/thumbnail decoding.
+    # IFD0 (which holds Image DateTime) is always walked before the
+    # EXIF IFD, so one pass still sees every fallback tag.
+    options = dict(stop_tag='DateTimeOriginal', details=False, debug=False,
+                   extract_thumbnail=False)
+
+    tags = {}
+
+    # A JPEG whose APP1 segment is cut off by the header would parse badly,
+    # so only hand over the header slice when the segment is complete
+    if not header.startswith(JPEG_SOI) or _find_app1(header):
+        try:
+            tags = exifread.process_file(io.BytesIO(header), **options)
+        except Exception:
+            tags = {}
+
+    # Large TIFF/RAW headers: IFD0 may fit in the slice while the EXIF IFD
+    # lies beyond it, so reparse the whole file unless DateTimeOriginal
+    # was found and the EXIF IFD pointer stays inside the slice
+    exif_offset = tags.get('Image ExifOffset')
+    if ('EXIF DateTimeOriginal' not in tags
+            or (exif_offset is not None and exif_offset.values[0] >= EXIF_HEADER_SIZE)):
+        tags = exifread.process_file(f, **options)
+
+    return tags
+
+
+def _format_exif_date(date_str: str) -> Optional[str]:
+    """
+    Reformat an EXIF date string ("YYYY:MM:DD HH:MM:SS") as YYYY-MM-DD
+
+    Args:
+        date_str: Date string from an EXIF tag
+
+    Returns:
+        Date string in YYYY-MM-DD format or None if it is not a valid date
+    """
+    # Well-formed dates are sliced directly; placeholders such as
+    # "0000:00:00 00:00:00" fail the range checks and are rejected
+    if len(date_str) >= 10 and date_str[4] == ':' and date_str[7] == ':':
+        year, month, day = date_str[:4], date_str[5:7], date_str[8:10]
+        if (year + month + day).isdigit() and year != '0000' \
+                and '01' <= month <= '12' and '01' <= day <= '31':
+            return f"{year}-{month}-{day}"
+
+    # Defensive fallback for unusual but parseable formats
+    try:
+        date_obj = datetime.strptime(date_str, "%Y:%m:%d %H:%M:%S")
+        return date_obj.strftime("%Y-%m-%d")
+    except ValueError:
+        return None
+
+
+def _exif_date_from_file(f: BinaryIO) -> Optional[str]:
+    """
+    Read the EXIF date from an open image file, letting read errors propagate
+
+    Args:
+        f: Image file (or in-memory buffer) opened in binary mode
+
+    Returns:
+        Date string in YYYY-MM-DD format or None if no date found
+    """
+    header = f.read(EXIF_HEADER_SIZE)
+
+    # Parse JPEG EXIF directly, use exifread for everything else
+    tags = _jpeg_exif_dates(header)
+    if tags is None:
+        tags = _read_exif_tags(f, header)
+
+    # Try different EXIF date tags, most specific first
+    for tag in EXIF_DATE_TAGS:
+        if tag in tags:
+            date_text = _format_exif_date(str(tags[tag]))
+            if date_text is not None:
+                return date_text
+
+    return None
+
+
+def _read_exif_date(image_path: str) -> Optional[str]:
+    """
+    Read the EXIF date of an image, letting read errors propagate
+
+    Args:
+        image_path: Path to the image file
+
+    Returns:
+        Date string in YYYY-MM-DD format or None if no date found
+    """
+    with open(image_path, 'rb') as f:
+        return _exif_date_from_file(f)
+
+
+def _date_from_bytes(data: bytes) -> Optional[str]:
+    """
+    Read the EXIF date from image file contents already in memory
+
+    Args:
+        data: Contents of the image file
+
+    Returns:
+        Date string in YYYY-MM-DD format or None if no date found
+    """
+    return _exif_date_from_file(io.BytesIO(data))
+
+
 def extract_date_from_exif(image_path: str) -> Optional[str]:
     """
     Extract date from EXIF data and format as YYYY-MM-DD
@@ -46,30 +355,34 @@ def extract_date_from_exif(image_path: str) -> Optional[str]:
         Date string in YYYY-MM-DD format or None if no date found
     """
     try:
-        with open(image_path, 'rb') as f:
-            tags = exifread.process_file(f)
-
-            # Try different EXIF date tags
-            date_tags = [
-                'EXIF DateTimeOriginal',
-                'EXIF DateTime',
-                'Image DateTime'
-            ]
-
-            for tag in date_tags:
-                if tag in tags:
-                    date_str = str(tags[tag])
-                    # Parse EXIF date format: "YYYY:MM:DD HH:MM:SS"
-                    try:
-                        date_obj = datetime.strptime(date_str, "%Y:%m:%d %H:%M:%S")
-                        return date_obj.strftime("%Y-%m-%d")
-                    except ValueError:
-                        continue
-
+        return _read_exif_date(image_path)
     except Exception as e:
         print(f"Warning: Could not read EXIF data from {image_path}: {e}")
-
-    return None
+        return None
+
+
+# (x, y) of the text for each position, given
+# (img_width, img_height, text_width, text_height, margin)
+POSITION_TABLE = {
+    WatermarkPosition.TOP_LEFT:
+        lambda iw, ih, tw, th, m: (m, m),
+    WatermarkPosition.TOP_CENTER:
+        lambda iw, ih, tw, th, m: ((iw - tw) // 2, m),
+    WatermarkPosition.TOP_RIGHT:
+        lambda iw, ih, tw, th, m: (iw - tw - m, m),
+    WatermarkPosition.CENTER_LEFT:
+        lambda iw, ih, tw, th, m: (m, (ih - th) // 2),
+    WatermarkPosition.CENTER:
+        lambda iw, ih, tw, th, m: ((iw - tw) // 2, (ih - th) // 2),
+    WatermarkPosition.CENTER_RIGHT:
+        lambda iw, ih, tw, th, m: (iw - tw - m, (ih - th) // 2),
+    WatermarkPosition.BOTTOM_LEFT:
+        lambda iw, ih, tw, th, m: (m, ih - th - m),
+    WatermarkPosition.BOTTOM_CENTER:
+        lambda iw, ih, tw, th, m: ((iw - tw) // 2, ih - th - m),
+    WatermarkPosition.BOTTOM_RIGHT:
+        lambda iw, ih, tw, th, m: (iw - tw - m, ih - th - m),
+}
 
 
 def get_watermark_position(image_size: Tuple[int, int], text_size: Tuple[int, int],
@@ -85,32 +398,145 @@ def get_watermark_position(image_size: Tuple[int, int], text_size: Tuple[int, in
 
     Returns:
         (x, y) coordinates for text placement
+
+    Raises:
+        KeyError: If position is not one of WatermarkPosition.all_positions()
+    """
+    return POSITION_TABLE[position](*image_size, *text_size, margin)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_font(font_size: int) -> ImageFont.ImageFont:
+    """
+    Load the watermark font, cached per size so each process parses it once
+
+    Args:
+        font_size: Size of the font
+
+    Returns:
+        A system Arial font, or PIL's default font if none is available
+    """
+    # Try to use a system font, fallback to default
+    try:
+        return ImageFont.truetype("arial.ttf", font_size)
+    except OSError:
+        try:
+            return ImageFont.truetype("/System/Library/Fonts/Arial.ttf", font_size)
+        except OSError:
+            return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=64)
+def _text_size(date_text: str, font: ImageFont.ImageFont) -> Tuple[int, int]:
     """
-    img_width, img_height = image_size
-    text_width, text_height = text_size
+    Measure the watermark text, cached per text and font
+
+    Fonts hash by identity, and the ones used here come from _load_font's
+    cache, so repeated dates skip the glyph metric computation.
 
-    # Calculate x coordinate
-    if position.endswith('left'):
-        x = margin
-    elif position.endswith('right'):
-        x = img_width - text_width - margin
-    else:  # center
-        x = (img_width - text_width) // 2
+    Args:
+        date_text: Date text to measure
+        font: Font the text is drawn with
 
-    # Calculate y coordinate
-    if position.startswith('top'):
-        y = margin
-    elif position.startswith('bottom'):
-        y = img_height - text_height - margin
-    else:  # center
-        y = (img_height - text_height) // 2
+    Returns:
+        (width, height) of the text
+    """
+    draw = ImageDraw.Draw(Image.new('RGB', (1, 1)))
+    bbox = draw.textbbox((0, 0), date_text, font=font)
+    return (bbox[2] - bbox[0], bbox[3] - bbox[1])
 
-    return (x, y)
+
+@functools.lru_cache(maxsize=64)
+def _render_watermark_tile(date_text: str, font: ImageFont.ImageFont, font_color: str,
+                           shadow_offset: int) -> Tuple[Image.Image, Tuple[int, int]]:
+    """
+    Render the watermark text and its shadow once into a transparent tile
+
+    The tile is cropped to the glyph bounding box plus the shadow, so
+    pasting it touches no more of the image than the text itself.
+
+    Args:
+        date_text: Date text to render
+        font: Font the text is drawn with
+        font_color: Color of the text
+        shadow_offset: Offset of the black shadow in pixels
+
+    Returns:
+        (tile, (dx, dy)); the RGBA tile is pasted at the text position
+        plus (dx, dy), using itself as mask
+    """
+    scratch = ImageDraw.Draw(Image.new('L', (1, 1)))
+    left, top, right, bottom = scratch.textbbox((0, 0), date_text, font=font)
+    size = (right - left + shadow_offset, bottom - top + shadow_offset)
+
+    layers = []
+    for offset, color in ((shadow_offset, "black"), (0, font_color)):
+        mask = Image.new('L', size, 0)
+        ImageDraw.Draw(mask).text((offset - left, offset - top), date_text,
+                                  font=font, fill=255)
+        layer = Image.new('RGBA', size, color)
+        layer.putalpha(mask)
+        layers.append(layer)
+
+    # Text over shadow, keeping straight alpha for the final paste
+    return (Image.alpha_composite(*layers), (left, top))
+
+
+def _watermark_image(image_path: str, output_path: str, date_text: str,
+                     font_size: int = 36, font_color: str = "white",
+                     position: str = WatermarkPosition.BOTTOM_RIGHT,
+                     font: Optional[ImageFont.ImageFont] = None,
+                     data: Optional[bytes] = None) -> None:
+    """
+    Add date watermark to image, letting errors propagate
+
+    Takes the same arguments as add_watermark, plus the file contents in
+    data when the caller has already read them.
+    """
+    # Open image, from memory if the file has been read already
+    with Image.open(io.BytesIO(data) if data is not None else image_path) as img:
+        # Convert to RGB if necessary, keeping transparency where the
+        # source has it instead of flattening it away
+        if img.mode not in ('RGB', 'RGBA'):
+            has_alpha = img.mode in ('LA', 'PA') or 'transparency' in img.info
+            img = img.convert('RGBA' if has_alpha else 'RGB')
+
+        if font is None:
+            font = _load_font(font_size)
+
+        # Calculate position
+        x, y = get_watermark_position(img.size, _text_size(date_text, font), position)
+
+        # Add text with shadow for better visibility; the tile is
+        # rasterized once per date and then only blitted
+        shadow_offset = max(1, font_size // 24)
+        tile, (dx, dy) = _render_watermark_tile(date_text, font, font_color, shadow_offset)
+        if img.mode == 'RGBA':
+            # paste() would also blend the tile into the alpha channel
+            img.alpha_composite(tile, (x + dx, y + dy))
+        else:
+            img.paste(tile, (x + dx, y + dy), tile)
+
+        # Encode in memory and write the file in one go, so a failed
+        # encode never leaves a partial output that looks up to date
+        save_format = Image.registered_extensions()[Path(output_path).suffix.lower()]
+        buffer = io.BytesIO()
+
+        # An unconverted JPEG source reuses its own quantization tables
+        # and subsampling instead of recomputing them
+        if img.format == 'JPEG':
+            img.save(buffer, format=save_format, quality='keep',
+                     subsampling='keep', optimize=False)
+        else:
+            img.save(buffer, format=save_format, quality=95, optimize=False)
+
+        Path(output_path).write_bytes(buffer.getbuffer())
 
 
 def add_watermark(image_path: str, output_path: str, date_text: str,
                  font_size: int = 36, font_color: str = "white",
-                 position: str = WatermarkPosition.BOTTOM_RIGHT) -> bool:
+                 position: str = WatermarkPosition.BOTTOM_RIGHT,
+                 font: Optional[ImageFont.ImageFont] = None) -> bool:
     """
     Add date watermark to image
 
@@ -121,53 +547,288 @@ def add_watermark(image_path: str, output_path: str, date_text: str,
         font_size: Size of the font
         font_color: Color of the text
         position: Position of the watermark
+        font: Preloaded font; loaded (and cached) from font_size when None
 
     Returns:
         True if successful, False otherwise
     """
     try:
-        # Open image
-        with Image.open(image_path) as img:
-            # Convert to RGB if necessary
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
+        _watermark_image(image_path, output_path, date_text,
+                         font_size, font_color, position, font)
+        return True
+    except Exception as e:
+        print(f"Error processing {image_path}: {e}")
+        return False
 
-            # Create drawing context
-            draw = ImageDraw.Draw(img)
 
-            # Try to use a system font, fallback to default
-            try:
-                font = ImageFont.truetype("arial.ttf", font_size)
-            except OSError:
-                try:
-                    font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", font_size)
-                except OSError:
-                    font = ImageFont.load_default()
-
-            # Get text dimensions
-            bbox = draw.textbbox((0, 0), date_text, font=font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
-
-            # Calculate position
-            x, y = get_watermark_position(img.size, (text_width, text_height), position)
-
-            # Add text with shadow for better visibility
-            shadow_offset = max(1, font_size // 24)
-            draw.text((x + shadow_offset, y + shadow_offset), date_text,
-                     font=font, fill="black")
-            draw.text((x, y), date_text, font=font, fill=font_color)
-
-            # Save image
-            img.save(output_path, quality=95)
-            return True
+def _watermark_image_cv2(image_path: str, output_path: str, date_text: str,
+                         font_size: int = 36, font_color: str = "white",
+                         position: str = WatermarkPosition.BOTTOM_RIGHT,
+                         data: Optional[bytes] = None) -> None:
+    """
+    Add date watermark to image with OpenCV, letting errors propagate
 
+    Takes the same arguments as add_watermark_cv2, plus the file contents
+    in data when the caller has already read them.
+    """
+    if data is None:
+        data = Path(image_path).read_bytes()
+
+    # Keep the stored pixel orientation, like the PIL path does
+    img = cv2.imdecode(np.frombuffer(data, dtype=np.uint8),
+                       cv2.IMREAD_COLOR | cv2.IMREAD_IGNORE_ORIENTATION)
+    if img is None:
+        raise ValueError("cannot decode image")
+
+    # Scale the Hershey font so the text is font_size pixels tall
+    thickness = max(1, font_size // 18)
+    scale = cv2.getFontScaleFromHeight(CV2_FONT, font_size, thickness)
+    (text_width, text_height), _ = cv2.getTextSize(date_text, CV2_FONT, scale, thickness)
+
+    # Calculate position; putText anchors text at its bottom-left corner
+    img_height, img_width = img.shape[:2]
+    x, y = get_watermark_position((img_width, img_height), (text_width, text_height), position)
+    y += text_height
+
+    # Add text with shadow for better visibility
+    red, green, blue = ImageColor.getrgb(font_color)[:3]
+    shadow_offset = max(1, font_size // 24)
+    cv2.putText(img, date_text, (x + shadow_offset, y + shadow_offset), CV2_FONT,
+                scale, (0, 0, 0), thickness, cv2.LINE_AA)
+    cv2.putText(img, date_text, (x, y), CV2_FONT,
+                scale, (blue, green, red), thickness, cv2.LINE_AA)
+
+    # Encode in memory and write the file in one go
+    params = []
+    if Path(output_path).suffix.lower() in ('.jpg', '.jpeg'):
+        params = [cv2.IMWRITE_JPEG_QUALITY, 95]
+    ok, buffer = cv2.imencode(Path(output_path).suffix, img, params)
+    if not ok:
+        raise ValueError("cannot encode image")
+    Path(output_path).write_bytes(buffer.tobytes())
+
+
+def add_watermark_cv2(image_path: str, output_path: str, date_text: str,
+                      font_size: int = 36, font_color: str = "white",
+                      position: str = WatermarkPosition.BOTTOM_RIGHT) -> bool:
+    """
+    Add date watermark to image using OpenCV (requires opencv-python)
+
+    Faster than add_watermark, but draws with OpenCV's Hershey font
+    instead of Arial and does not keep transparency.
+
+    Args:
+        image_path: Path to input image
+        output_path: Path to save watermarked image
+        date_text: Date text to add as watermark
+        font_size: Height of the text in pixels
+        font_color: Color of the text
+        position: Position of the watermark
+
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        _watermark_image_cv2(image_path, output_path, date_text,
+                             font_size, font_color, position)
+        return True
     except Exception as e:
         print(f"Error processing {image_path}: {e}")
         return False
 
 
-def process_images(input_path: str, font_size: int, font_color: str, position: str) -> None:
+def _process_one(task: Tuple[str, str, int, str, str],
+                 watermark=_watermark_image) -> Tuple[str, bool, str]:
+    """
+    Extract the date from one image and watermark it
+
+    Args:
+        task: (image_path, output_path, font_size, font_color, position)
+        watermark: _watermark_image, or _watermark_image_cv2 for --fast
+
+    Returns:
+        (image_path, ok, detail); detail is the date when ok, otherwise
+        the reason the image was skipped
+    """
+    image_path, output_path, font_size, font_color, position = task
+
+    # Read the file once and drive both EXIF parsing and decoding from memory
+    try:
+        data = Path(image_path).read_bytes()
+    except OSError as e:
+        return (image_path, False, f"could not read file: {e}")
+
+    # Extract date from EXIF
+    try:
+        date_text = _date_from_bytes(data)
+    except Exception as e:
+        return (image_path, False, f"could not read EXIF data: {e}")
+    if date_text is None:
+        return (image_path, False, "no date found in EXIF data")
+
+    # Add watermark
+    try:
+        watermark(image_path, output_path, date_text,
+                  font_size, font_color, position, data=data)
+    except Exception as e:
+        return (image_path, False, f"failed to process: {e}")
+    return (image_path, True, date_text)
+
+
+def _pipeline(tasks: Iterable[Tuple[str, str, int, str, str]], workers: int,
+              watermark=_watermark_image) -> Iterator[Tuple[str, bool, str]]:
+    """
+    Read EXIF dates in threads while a process pool watermarks the images
+
+    Args:
+        tasks: (image_path, output_path, font_size, font_color, position) tuples,
+            consumed lazily
+        workers: Number of watermarking processes
+        watermark: _watermark_image, or _watermark_image_cv2 for --fast
+
+    Yields:
+        (image_path, ok, detail) in task order, as for _process_one
+    """
+    # Bounded so reading ahead never runs far past the encoders
+    pending = queue.Queue(maxsize=2 * workers)
+
+    with ThreadPoolExecutor(max_workers=EXIF_READ_THREADS) as readers, \
+            ProcessPoolExecutor(max_workers=workers) as encoders:
+
+        def dispatch(task, read):
+            image_path, output_path, *style = task
+            try:
+                date_text = read.result()
+            except Exception as e:
+                pending.put((image_path, None, f"could not read EXIF data: {e}"))
+                return
+            if date_text is None:
+                pending.put((image_path, None, "no date found in EXIF data"))
+                return
+            future = encoders.submit(watermark, image_path, output_path,
+                                     date_text, *style)
+            pending.put((image_path, future, date_text))
+
+        def feed():
+            try:
+                # Keep a small window of EXIF reads in flight
+                reads = collections.deque()
+                for task in tasks:
+                    reads.append((task, readers.submit(_read_exif_date, task[0])))
+                    if len(reads) >= 2 * EXIF_READ_THREADS:
+                        dispatch(*reads.popleft())
+                while reads:
+                    dispatch(*reads.popleft())
+            except BaseException as e:
+                # Hand the error to the consumer rather than ending the
+                # stream cleanly, which would silently drop the rest
+                pending.put(e)
+            else:
+                pending.put(None)
+
+        feeder = threading.Thread(target=feed, daemon=True)
+        feeder.start()
+
+        while True:
+            item = pending.get()
+            if item is None:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            image_path, future, detail = item
+            if future is None:
+                yield (image_path, False, detail)
+                continue
+            try:
+                future.result()
+            except Exception as e:
+                yield (image_path, False, f"failed to process: {e}")
+            else:
+                yield (image_path, True, detail)
+
+
+class _Progress:
+    """
+    Progress reporting from the main process
+
+    Shows a tqdm bar on an interactive terminal, otherwise (or without
+    tqdm) prints one summary line every PROGRESS_INTERVAL images.
+    """
+
+    def __init__(self):
+        self.processed = 0
+        self.skipped = 0
+        self.bar = None
+        if tqdm is not None and sys.stdout.isatty():
+            self.bar = tqdm(unit="image")
+
+    def update(self, ok: bool) -> None:
+        """Count one finished image"""
+        if ok:
+            self.processed += 1
+        else:
+            self.skipped += 1
+
+        if self.bar is not None:
+            self.bar.update()
+        elif (self.processed + self.skipped) % PROGRESS_INTERVAL == 0:
+            print(f"  {self.processed + self.skipped} image(s) done: "
+                  f"{self.processed} processed, {self.skipped} skipped")
+
+    def write(self, message: str) -> None:
+        """Print a message without breaking the progress bar"""
+        if self.bar is not None:
+            self.bar.write(message)
+        else:
+            print(message)
+
+    def close(self) -> None:
+        if self.bar is not None:
+            self.bar.close()
+
+
+def _iter_images(root: Path) -> Iterator[Path]:
+    """
+    Iterate over the supported image files in a directory
+
+    scandir entries know their file type from readdir, so this needs no
+    extra stat per entry, and paths are yielded as the directory is read.
+
+    Args:
+        root: Directory to scan
+
+    Yields:
+        Path of each image file
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS:
+                yield Path(entry.path)
+
+
+def _is_up_to_date(image_file: Path, output_file: Path) -> bool:
+    """
+    Check whether the watermarked output is at least as new as its source
+
+    Any stat error (a missing output, but also e.g. a permission error)
+    counts as not up to date: the image is then processed as usual, and
+    a real problem is reported for that image instead of aborting the run.
+
+    Args:
+        image_file: Path to the source image
+        output_file: Path to the watermarked image
+
+    Returns:
+        True if the output exists and is not older than the source
+    """
+    try:
+        return output_file.stat().st_mtime >= image_file.stat().st_mtime
+    except OSError:
+        return False
+
+
+def process_images(input_path: str, font_size: int, font_color: str, position: str,
+                   force: bool = False, fast: bool = False) -> None:
     """
     Process all images in the input directory
 
@@ -176,6 +837,8 @@ def process_images(input_path: str, font_size: int, font_color: str, position: s
         font_size: Font size for watermark
         font_color: Font color for watermark
         position: Position for watermark
+        force: Reprocess images whose output is already up to date
+        fast: Draw with OpenCV instead of PIL (requires opencv-python)
     """
     input_path = Path(input_path)
 
@@ -185,59 +848,73 @@ def process_images(input_path: str, font_size: int, font_color: str, position: s
 
     # Determine input files
     if input_path.is_file():
-        if input_path.suffix.lower() in ['.jpg', '.jpeg', '.png', '.bmp', '.tiff']:
-            image_files = [input_path]
+        if input_path.suffix.lower() in IMAGE_EXTENSIONS:
+            image_files = iter([input_path])
             base_dir = input_path.parent
         else:
             print(f"Error: {input_path} is not a supported image file")
             return
     else:
-        # Get all image files from directory
-        image_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff'}
-        image_files = [f for f in input_path.iterdir()
-                      if f.is_file() and f.suffix.lower() in image_extensions]
+        # Stream the directory instead of listing it up front
+        image_files = _iter_images(input_path)
         base_dir = input_path
 
-    if not image_files:
+    first = next(image_files, None)
+    if first is None:
         print(f"No image files found in {input_path}")
         return
+    image_files = itertools.chain([first], image_files)
 
     # Create output directory
     output_dir = base_dir / f"{base_dir.name}_watermark"
     output_dir.mkdir(exist_ok=True)
 
-    processed = 0
-    skipped = 0
+    up_to_date = 0
 
-    print(f"Processing {len(image_files)} image(s)...")
+    print(f"Processing images in {input_path}...")
     print(f"Output directory: {output_dir}")
 
-    for image_file in image_files:
-        print(f"Processing: {image_file.name}")
-
-        # Extract date from EXIF
-        date_text = extract_date_from_exif(str(image_file))
-
-        if date_text is None:
-            print(f"  Warning: No date found in EXIF data, skipping")
-            skipped += 1
-            continue
-
-        print(f"  Date found: {date_text}")
+    def pending_files():
+        # Skip images watermarked by a previous run unless forced
+        nonlocal up_to_date
+        for image_file in image_files:
+            if not force and _is_up_to_date(image_file, output_dir / image_file.name):
+                up_to_date += 1
+                continue
+            yield image_file
+
+    if fast:
+        watermark = _watermark_image_cv2
+    else:
+        watermark = _watermark_image
+        # Load the font once up front; forked workers inherit the cached font
+        _load_font(font_size)
+
+    tasks = ((str(image_file), str(output_dir / image_file.name),
+              font_size, font_color, position)
+             for image_file in pending_files())
+
+    # Only start the process pool if there is enough work to pay for it
+    head = list(itertools.islice(tasks, MIN_PARALLEL_IMAGES))
+    if len(head) >= MIN_PARALLEL_IMAGES:
+        results = _pipeline(itertools.chain(head, tasks), os.cpu_count() or 1, watermark)
+    else:
+        results = map(functools.partial(_process_one, watermark=watermark), head)
 
-        # Generate output path
-        output_file = output_dir / image_file.name
+    progress = _Progress()
+    try:
+        for image_file, ok, detail in results:
+            if not ok:
+                progress.write(f"Skipped {Path(image_file).name}: {detail}")
+            progress.update(ok)
+    finally:
+        progress.close()
 
-        # Add watermark
-        if add_watermark(str(image_file), str(output_file), date_text,
-                        font_size, font_color, position):
-            print(f"  ✓ Saved: {output_file}")
-            processed += 1
-        else:
-            print(f"  ✗ Failed to process")
-            skipped += 1
+    if up_to_date:
+        print(f"Skipped {up_to_date} up-to-date image(s) (use --force to reprocess)")
 
-    print(f"\nCompleted: {processed} processed, {skipped} skipped")
+    print(f"\nCompleted: {progress.processed} processed, "
+          f"{progress.skipped + up_to_date} skipped")
 
 
 def main():
@@ -281,6 +958,19 @@ Examples:
         help=f'Position of watermark (default: {WatermarkPosition.BOTTOM_RIGHT})'
     )
 
+    parser.add_argument(
+        '--fast',
+        action='store_true',
+        help='Use OpenCV for decoding, drawing and encoding (faster, requires '
+             'opencv-python; uses a Hershey font instead of Arial and drops transparency)'
+    )
+
+    parser.add_argument(
+        '--force', '-f',
+        action='store_true',
+        help='Reprocess images even if the watermarked output is newer than the source'
+    )
+
     args = parser.parse_args()
 
     # Validate font size
@@ -288,8 +978,13 @@ Examples:
         print("Error: Font size must be positive")
         sys.exit(1)
 
+    if args.fast and (cv2 is None or np is None):
+        print("Error: --fast requires OpenCV (pip install opencv-python)")
+        sys.exit(1)
+
     # Process images
-    process_images(args.path, args.font_size, args.color, args.position)
+    process_images(args.path, args.font_size, args.color, args.position,
+                   args.force, args.fast)
 
 
 if __name__ == '__main__':